@@ -3,6 +3,8 @@ import os
 import sys
 import zipfile
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
 from pathlib import Path
 import xml.etree.ElementTree as ET
@@ -18,6 +20,21 @@ REPO_NAME = os.environ.get('GITHUB_REPOSITORY', '').replace('/', '-')
 
 MAX_BACKUPS = 5
 
+# 复用连接：Telegram 与 WebDAV 请求共享同一个会话
+session = requests.Session()
+# WebDAV 列表/删除遇到 429、5xx 时指数退避重试（上传的文件流无法重放，不重试）
+retry_adapter = HTTPAdapter(max_retries=Retry(
+    total=3,
+    backoff_factor=0.5,
+    backoff_jitter=0.2,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=['PROPFIND', 'DELETE'],
+    respect_retry_after_header=True,
+    raise_on_status=False
+))
+session.mount('https://', retry_adapter)
+session.mount('http://', retry_adapter)
+
 def parse_webdav_config():
     """解析 WEBDAV 配置"""
     if not WEBDAV:
@@ -50,7 +67,7 @@ def send_telegram_message(message):
     }
 
     try:
-        response = requests.post(url, json=data, timeout=10)
+        response = session.post(url, json=data, timeout=10)
         if response.status_code == 200:
             print("✅ Telegram 通知发送成功")
         else:
@@ -147,7 +164,7 @@ def upload_to_webdav(backup_path):
 
     try:
         with open(backup_path, 'rb') as f:
-            response = requests.put(
+            response = session.put(
                 upload_url,
                 auth=(username, password),
                 data=f,
@@ -182,7 +199,7 @@ def list_webdav_backups():
         return []
 
     try:
-        response = requests.request(
+        response = session.request(
             'PROPFIND',
             webdav_url,
             auth=(username, password),
@@ -238,7 +255,7 @@ def delete_old_backups():
     for filename in to_delete:
         delete_url = webdav_url.rstrip('/') + '/' + filename
         try:
-            response = requests.delete(
+            response = session.delete(
                 delete_url,
                 auth=(username, password),
                 timeout=30